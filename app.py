@@ -9,19 +9,32 @@ This file contains the Plotly Dash app showing off some Boggle analytics.
 
 # General import statements
 import pandas as pd
+import json
+from functools import lru_cache
+from pathlib import Path
 
 # Dash-related import statements
 import dash
 from dash import html, dcc, callback, Output, Input, State
+from dash.exceptions import PreventUpdate
 import dash_bootstrap_components as dbc
 import dash_mantine_components as dmc
+from flask_caching import Cache
 
 # Importing different custom modules
 from utils.visualizations import (
+    RoundArrays,
     percentage_of_total_points_scored_line_graph,
     win_loss_heatmap,
     round_score_distribution_boxplot,
     total_wins_bar_chart,
+    warm_up_kernels,
+)
+from utils.settings import (
+    DEFAULT_ROLLING_AVG_WINDOW_SIZE,
+    DEFAULT_PCT_POINTS_SCORED_INPUTS,
+    DEFAULT_WIN_LOSS_HEATMAP_INPUTS,
+    DEFAULT_ROUND_SCORE_DISTRIBUTION_INPUTS,
 )
 
 # Set up the app
@@ -31,9 +44,52 @@ app = dash.Dash(
     meta_tags=[{"name": "viewport", "content": "width=device-width, initial-scale=1"}],
 )
 
-# Load in the data
-round_level_stats_df = pd.read_excel("data/round-level-stats.xlsx")
-game_level_stats_df = pd.read_excel("data/game-level-stats.xlsx")
+# Set up a cache for the serialized figures, so that repeat callback inputs skip figure construction
+FIGURE_CACHE_TIMEOUT = 3600
+cache = Cache(app.server, config={"CACHE_TYPE": "SimpleCache"})
+
+# Compile the visualization kernels up front, so the first callback doesn't pay for it
+warm_up_kernels()
+
+
+# ======================
+# DEFINING DATA LOADERS
+# ======================
+# Below, I'm going to define some methods that load the data the first time it's needed, rather than at import.
+
+
+# The Parquet files that the pipeline saves the stats to
+ROUND_LEVEL_STATS_PATH = Path("data/round-level-stats.parquet")
+GAME_LEVEL_STATS_PATH = Path("data/game-level-stats.parquet")
+STATS_PATHS = (ROUND_LEVEL_STATS_PATH, GAME_LEVEL_STATS_PATH)
+
+
+@lru_cache(maxsize=1)
+def load_round_level_stats_df() -> pd.DataFrame:
+    """
+    This method will load the round-level stats produced by the pipeline. The result is cached,
+    so the file is only read once per process.
+    """
+    return pd.read_parquet(ROUND_LEVEL_STATS_PATH)
+
+
+@lru_cache(maxsize=1)
+def load_game_level_stats_df() -> pd.DataFrame:
+    """
+    This method will load the game-level stats produced by the pipeline. The result is cached,
+    so the file is only read once per process.
+    """
+    return pd.read_parquet(GAME_LEVEL_STATS_PATH)
+
+
+@lru_cache(maxsize=1)
+def load_round_arrays() -> RoundArrays:
+    """
+    This method will pull the round-level columns used by the line graph out as NumPy arrays,
+    so that its callback doesn't need to re-select them from the DataFrame every time.
+    """
+    return RoundArrays.from_df(load_round_level_stats_df())
+
 
 # =======================
 # DEFINING THE APP LAYOUT
@@ -42,312 +98,505 @@ game_level_stats_df = pd.read_excel("data/game-level-stats.xlsx")
 
 # Define some constants for the app layout
 ROW_SPAING = "20px"
-DEFAULT_ROLLING_AVG_WINDOW_SIZE = 15
 
-# Assign the app layout
-app.layout = dbc.Container(
-    children=[
-        # HEADER
-        dbc.Row(
-            children=[
-                dbc.Col(
-                    children=[
-                        dmc.Text("Boggle Analytics", size="2rem", weight=700),
-                        dmc.Text(
-                            "Miscellaneous stats about our performance in Boggle",
-                            size="1.25rem",
-                            italic=True,
-                        ),
-                    ],
-                    width=12,
-                )
-            ],
-            style={
-                "marginBottom": ROW_SPAING,
-            },
+
+def load_default_fig(fig_name: str, build_fig):
+    """
+    This method will load the JSON for one of the default figures, which the pipeline saves
+    to data/figs/. If that file doesn't exist (or it's older than the stats it'd be shown
+    alongside, e.g. because the last pipeline run failed partway), the figure is built instead.
+
+    Args:
+        - fig_name (str): The name of the figure's JSON file (without the extension).
+        - build_fig: A function that builds the figure, in case the JSON file is missing or stale.
+    """
+    fig_path = Path(f"data/figs/{fig_name}.json")
+    if fig_path.exists():
+        stats_mtimes = [
+            stats_path.stat().st_mtime_ns
+            for stats_path in STATS_PATHS
+            if stats_path.exists()
+        ]
+        if fig_path.stat().st_mtime_ns >= max(stats_mtimes, default=0):
+            return json.loads(fig_path.read_text())
+    return build_fig()
+
+
+# Each figure is loaded for its initial controls once (the first time it's needed), so the layout and
+# the first callbacks can share it.
+@lru_cache(maxsize=1)
+def default_total_wins_fig():
+    """
+    This method will load the "Total Wins" bar chart.
+    """
+    return load_default_fig(
+        "total-wins-bar-chart",
+        lambda: total_wins_bar_chart(game_level_stats_df=load_game_level_stats_df()),
+    )
+
+
+@lru_cache(maxsize=1)
+def default_pct_points_scored_fig():
+    """
+    This method will load the "Percentage of Total Points Scored" line graph for its initial controls.
+    """
+    return load_default_fig(
+        "pct-points-scored-line-graph",
+        lambda: percentage_of_total_points_scored_line_graph(
+            round_level_stats_df=load_round_arrays(),
+            **DEFAULT_PCT_POINTS_SCORED_INPUTS,
         ),
-        # TOTAL WINS
-        dbc.Row(
-            children=[
-                dbc.Col(
-                    children=[
-                        dmc.Text(
-                            "Total Wins",
-                            size="1.5rem",
-                            weight=600,
-                        ),
-                        dcc.Markdown(
-                            """
-                            This chart shows the total number of games won by each player. 
-                            It's a good way to see who's been winning more games overall.
-                            """,
-                        ),
-                        dcc.Graph(
-                            id="total-wins-bar-chart",
-                            figure=total_wins_bar_chart(
-                                game_level_stats_df=game_level_stats_df
-                            ),
-                            config={"displayModeBar": False},
-                        ),
-                    ],
-                    width=12,
-                )
-            ],
-            style={"marginBottom": ROW_SPAING},
+    )
+
+
+@lru_cache(maxsize=1)
+def default_win_loss_heatmap_fig():
+    """
+    This method will load the "Win-Loss Heatmap" for its initial controls.
+    """
+    return load_default_fig(
+        "win-loss-heatmap",
+        lambda: win_loss_heatmap(
+            game_level_stats_df=load_game_level_stats_df(),
+            **DEFAULT_WIN_LOSS_HEATMAP_INPUTS,
         ),
-        # PERCENTAGE OF TOTAL POINTS SCORED
-        dbc.Row(
-            children=[
-                dbc.Col(
-                    children=[
-                        dmc.Text(
-                            "Percentage of Total Points Scored",
-                            size="1.5rem",
-                            weight=600,
-                        ),
-                        dcc.Markdown(
-                            """
-                            This chart normalizes the points scored in each round to the maximum possible points in that round. 
-                            It's a good look at how well we're doing over time, and normalizes for the fact that some rounds are just harder than others.
-                            """,
-                        ),
-                        dbc.Row(
-                            children=[
-                                dbc.Col(
-                                    md=9,
-                                    xs=12,
-                                    children=[
-                                        dcc.Graph(
-                                            id="pct-points-scored-line-graph",
-                                            figure=percentage_of_total_points_scored_line_graph(
-                                                round_level_stats_df=round_level_stats_df,
-                                                rolling_avg_window_size=DEFAULT_ROLLING_AVG_WINDOW_SIZE,
-                                            ),
-                                            config={"displayModeBar": False},
-                                        ),
-                                    ],
-                                    style={"paddingRight": "5px"},
-                                ),
-                                dbc.Col(
-                                    md=3,
-                                    xs=12,
-                                    children=[
-                                        dmc.Text(
-                                            "Controls",
-                                            size="1.2rem",
-                                            weight=500,
-                                            style={"marginBottom": "10px"},
-                                        ),
-                                        html.Div(
-                                            [
-                                                dmc.Checkbox(
-                                                    id="pct-points-scored-show-each-round",
-                                                    label="Show Each Round",
-                                                    checked=True,
-                                                ),
-                                            ],
-                                            style={"marginBottom": "20px"},
-                                        ),
-                                        html.Div(
-                                            [
-                                                dmc.Checkbox(
-                                                    id="pct-points-scored-show-dates",
-                                                    label="Show Dates",
-                                                    checked=False,
-                                                ),
-                                            ],
-                                            style={"marginBottom": "20px"},
-                                        ),
-                                        html.Div(
-                                            [
-                                                dmc.Text(
-                                                    "Rolling Avg. Window (Rounds)",
-                                                    size="0.95rem",
-                                                ),
-                                                html.Div(
-                                                    children=[
-                                                        dmc.Slider(
-                                                            id="pct-points-scored-rolling-avg-slider",
-                                                            value=DEFAULT_ROLLING_AVG_WINDOW_SIZE,
-                                                            min=1,
-                                                            max=30,
-                                                            step=1,
-                                                            updatemode="drag",
-                                                        ),
-                                                    ],
-                                                    style={"width": "50%"},
-                                                ),
-                                            ]
-                                        ),
-                                    ],
-                                ),
-                            ]
-                        ),
-                    ]
-                )
-            ],
-            style={"marginBottom": ROW_SPAING},
+    )
+
+
+@lru_cache(maxsize=1)
+def default_round_score_distribution_fig():
+    """
+    This method will load the "Round Score Distribution" boxplot for its initial controls.
+    """
+    return load_default_fig(
+        "round-score-distribution-boxplot",
+        lambda: round_score_distribution_boxplot(
+            round_level_stats_df=load_round_level_stats_df(),
+            **DEFAULT_ROUND_SCORE_DISTRIBUTION_INPUTS,
         ),
-        # WIN-LOSS HEATMAP
-        dbc.Row(
-            children=[
-                dbc.Col(
-                    children=[
-                        dmc.Text(
-                            "Win Streaks",
-                            size="1.5rem",
-                            weight=600,
-                        ),
-                        dcc.Markdown(
-                            """
-                            Below, I've mapped out each of our wins over time. You can see our longest streak of games won!
-                            """,
-                        ),
-                        dbc.Row(
-                            children=[
-                                dbc.Col(
-                                    md=9,
-                                    xs=12,
-                                    children=[
-                                        dcc.Graph(
-                                            id="win-loss-heatmap",
-                                            figure=win_loss_heatmap(
-                                                game_level_stats_df=game_level_stats_df
-                                            ),
-                                            config={"displayModeBar": False},
-                                        ),
-                                    ],
-                                    style={"paddingRight": "5px"},
+    )
+
+
+def serve_layout(load_figures: bool = True):
+    """
+    This method will build the app layout. Dash calls it when a page is served, which means
+    that the data and the default figures aren't loaded until they're actually needed.
+
+    Args:
+        - load_figures (bool): Whether to load the default figures into the graphs. When this is
+            False, the graphs are left empty, so the layout can be built without touching the data.
+    """
+    return dbc.Container(
+        children=[
+            # HEADER
+            dbc.Row(
+                children=[
+                    dbc.Col(
+                        children=[
+                            dmc.Text("Boggle Analytics", size="2rem", weight=700),
+                            dmc.Text(
+                                "Miscellaneous stats about our performance in Boggle",
+                                size="1.25rem",
+                                italic=True,
+                            ),
+                        ],
+                        width=12,
+                    )
+                ],
+                style={
+                    "marginBottom": ROW_SPAING,
+                },
+            ),
+            # TOTAL WINS
+            dbc.Row(
+                children=[
+                    dbc.Col(
+                        children=[
+                            dmc.Text(
+                                "Total Wins",
+                                size="1.5rem",
+                                weight=600,
+                            ),
+                            dcc.Markdown(
+                                """
+                                This chart shows the total number of games won by each player. 
+                                It's a good way to see who's been winning more games overall.
+                                """,
+                            ),
+                            dcc.Graph(
+                                id="total-wins-bar-chart",
+                                figure=(
+                                    default_total_wins_fig() if load_figures else None
                                 ),
-                                dbc.Col(
-                                    md=3,
-                                    xs=12,
-                                    children=[
-                                        dmc.Text(
-                                            "Controls",
-                                            size="1.2rem",
-                                            weight=500,
-                                            style={"marginBottom": "10px"},
-                                        ),
-                                        html.Div(
-                                            [
-                                                dmc.Checkbox(
-                                                    id="win-loss-heatmap-show-longest-streak",
-                                                    label="Show Longest Streak",
-                                                    checked=True,
+                                config={"displayModeBar": False},
+                            ),
+                        ],
+                        width=12,
+                    )
+                ],
+                style={"marginBottom": ROW_SPAING},
+            ),
+            # PERCENTAGE OF TOTAL POINTS SCORED
+            dbc.Row(
+                children=[
+                    dbc.Col(
+                        children=[
+                            dmc.Text(
+                                "Percentage of Total Points Scored",
+                                size="1.5rem",
+                                weight=600,
+                            ),
+                            dcc.Markdown(
+                                """
+                                This chart normalizes the points scored in each round to the maximum possible points in that round. 
+                                It's a good look at how well we're doing over time, and normalizes for the fact that some rounds are just harder than others.
+                                """,
+                            ),
+                            dbc.Row(
+                                children=[
+                                    dbc.Col(
+                                        md=9,
+                                        xs=12,
+                                        children=[
+                                            dcc.Graph(
+                                                id="pct-points-scored-line-graph",
+                                                figure=(
+                                                    default_pct_points_scored_fig()
+                                                    if load_figures
+                                                    else None
                                                 ),
-                                            ],
-                                            style={"marginBottom": "20px"},
-                                        ),
-                                        html.Div(
-                                            [
-                                                dmc.Checkbox(
-                                                    id="win-loss-heatmap-show-dates",
-                                                    label="Show Dates",
-                                                    checked=False,
+                                                config={"displayModeBar": False},
+                                            ),
+                                            dcc.Store(
+                                                id="pct-points-scored-line-graph-inputs",
+                                                data=DEFAULT_PCT_POINTS_SCORED_INPUTS,
+                                            ),
+                                        ],
+                                        style={"paddingRight": "5px"},
+                                    ),
+                                    dbc.Col(
+                                        md=3,
+                                        xs=12,
+                                        children=[
+                                            dmc.Text(
+                                                "Controls",
+                                                size="1.2rem",
+                                                weight=500,
+                                                style={"marginBottom": "10px"},
+                                            ),
+                                            html.Div(
+                                                [
+                                                    dmc.Checkbox(
+                                                        id="pct-points-scored-show-each-round",
+                                                        label="Show Each Round",
+                                                        checked=DEFAULT_PCT_POINTS_SCORED_INPUTS[
+                                                            "show_each_round"
+                                                        ],
+                                                    ),
+                                                ],
+                                                style={"marginBottom": "20px"},
+                                            ),
+                                            html.Div(
+                                                [
+                                                    dmc.Checkbox(
+                                                        id="pct-points-scored-show-dates",
+                                                        label="Show Dates",
+                                                        checked=DEFAULT_PCT_POINTS_SCORED_INPUTS[
+                                                            "show_dates"
+                                                        ],
+                                                    ),
+                                                ],
+                                                style={"marginBottom": "20px"},
+                                            ),
+                                            html.Div(
+                                                [
+                                                    dmc.Text(
+                                                        "Rolling Avg. Window (Rounds)",
+                                                        size="0.95rem",
+                                                    ),
+                                                    html.Div(
+                                                        children=[
+                                                            dmc.Slider(
+                                                                id="pct-points-scored-rolling-avg-slider",
+                                                                value=DEFAULT_ROLLING_AVG_WINDOW_SIZE,
+                                                                min=1,
+                                                                max=30,
+                                                                step=1,
+                                                                updatemode="drag",
+                                                            ),
+                                                        ],
+                                                        style={"width": "50%"},
+                                                    ),
+                                                ]
+                                            ),
+                                        ],
+                                    ),
+                                ]
+                            ),
+                        ]
+                    )
+                ],
+                style={"marginBottom": ROW_SPAING},
+            ),
+            # WIN-LOSS HEATMAP
+            dbc.Row(
+                children=[
+                    dbc.Col(
+                        children=[
+                            dmc.Text(
+                                "Win Streaks",
+                                size="1.5rem",
+                                weight=600,
+                            ),
+                            dcc.Markdown(
+                                """
+                                Below, I've mapped out each of our wins over time. You can see our longest streak of games won!
+                                """,
+                            ),
+                            dbc.Row(
+                                children=[
+                                    dbc.Col(
+                                        md=9,
+                                        xs=12,
+                                        children=[
+                                            dcc.Graph(
+                                                id="win-loss-heatmap",
+                                                figure=(
+                                                    default_win_loss_heatmap_fig()
+                                                    if load_figures
+                                                    else None
                                                 ),
-                                            ],
-                                            style={"marginBottom": "20px"},
-                                        ),
-                                    ],
-                                ),
-                            ]
-                        ),
-                    ]
-                )
-            ],
-            style={"marginBottom": ROW_SPAING},
-        ),
-        # SCORING DISTRIBUTION
-        dbc.Row(
-            children=[
-                dbc.Col(
-                    width=12,
-                    children=[
-                        dmc.Text(
-                            "Scoring Distribution",
-                            size="1.5rem",
-                            weight=600,
-                        ),
-                        dcc.Markdown(
-                            """
-                            This chart shows the distribution of scores for each round. It's a good way to see how we're doing on average, and how consistent we are.
-                            """,
-                        ),
-                    ],
-                ),
-                dbc.Col(
-                    md=9,
-                    xs=12,
-                    children=[
-                        dcc.Graph(
-                            id="round-score-distribution-boxplot",
-                            figure=round_score_distribution_boxplot(
-                                round_level_stats_df=round_level_stats_df
+                                                config={"displayModeBar": False},
+                                            ),
+                                            dcc.Store(
+                                                id="win-loss-heatmap-inputs",
+                                                data=DEFAULT_WIN_LOSS_HEATMAP_INPUTS,
+                                            ),
+                                        ],
+                                        style={"paddingRight": "5px"},
+                                    ),
+                                    dbc.Col(
+                                        md=3,
+                                        xs=12,
+                                        children=[
+                                            dmc.Text(
+                                                "Controls",
+                                                size="1.2rem",
+                                                weight=500,
+                                                style={"marginBottom": "10px"},
+                                            ),
+                                            html.Div(
+                                                [
+                                                    dmc.Checkbox(
+                                                        id="win-loss-heatmap-show-longest-streak",
+                                                        label="Show Longest Streak",
+                                                        checked=DEFAULT_WIN_LOSS_HEATMAP_INPUTS[
+                                                            "show_longest_streak"
+                                                        ],
+                                                    ),
+                                                ],
+                                                style={"marginBottom": "20px"},
+                                            ),
+                                            html.Div(
+                                                [
+                                                    dmc.Checkbox(
+                                                        id="win-loss-heatmap-show-dates",
+                                                        label="Show Dates",
+                                                        checked=DEFAULT_WIN_LOSS_HEATMAP_INPUTS[
+                                                            "show_dates"
+                                                        ],
+                                                    ),
+                                                ],
+                                                style={"marginBottom": "20px"},
+                                            ),
+                                        ],
+                                    ),
+                                ]
                             ),
-                            config={"displayModeBar": False},
-                        ),
-                    ],
-                    style={"paddingRight": "5px"},
-                ),
-                dbc.Col(
-                    md=3,
-                    xs=12,
-                    children=[
-                        dmc.Text(
-                            "Controls",
-                            size="1.2rem",
-                            weight=500,
-                            style={"marginBottom": "10px"},
-                        ),
-                        html.Div(
-                            [
-                                dmc.Checkbox(
-                                    id="round-score-distribution-boxplot-violin-plot",
-                                    label="Violin Plot",
-                                    checked=False,
-                                ),
-                            ],
-                            style={"marginBottom": "20px"},
-                        ),
-                        html.Div(
-                            [
-                                dmc.Checkbox(
-                                    id="round-score-distribution-boxplot-use-potential-points",
-                                    label="Use Potential Points",
-                                    checked=False,
+                        ]
+                    )
+                ],
+                style={"marginBottom": ROW_SPAING},
+            ),
+            # SCORING DISTRIBUTION
+            dbc.Row(
+                children=[
+                    dbc.Col(
+                        width=12,
+                        children=[
+                            dmc.Text(
+                                "Scoring Distribution",
+                                size="1.5rem",
+                                weight=600,
+                            ),
+                            dcc.Markdown(
+                                """
+                                This chart shows the distribution of scores for each round. It's a good way to see how we're doing on average, and how consistent we are.
+                                """,
+                            ),
+                        ],
+                    ),
+                    dbc.Col(
+                        md=9,
+                        xs=12,
+                        children=[
+                            dcc.Graph(
+                                id="round-score-distribution-boxplot",
+                                figure=(
+                                    default_round_score_distribution_fig()
+                                    if load_figures
+                                    else None
                                 ),
-                            ],
-                            style={"marginBottom": "20px"},
-                        ),
-                    ],
-                ),
-            ]
-        ),
-    ],
-    fluid=True,
-    style={
-        "paddingLeft": "1.5rem",
-        "paddingRight": "1.5rem",
-    }
-)
+                                config={"displayModeBar": False},
+                            ),
+                            dcc.Store(
+                                id="round-score-distribution-boxplot-inputs",
+                                data=DEFAULT_ROUND_SCORE_DISTRIBUTION_INPUTS,
+                            ),
+                        ],
+                        style={"paddingRight": "5px"},
+                    ),
+                    dbc.Col(
+                        md=3,
+                        xs=12,
+                        children=[
+                            dmc.Text(
+                                "Controls",
+                                size="1.2rem",
+                                weight=500,
+                                style={"marginBottom": "10px"},
+                            ),
+                            html.Div(
+                                [
+                                    dmc.Checkbox(
+                                        id="round-score-distribution-boxplot-violin-plot",
+                                        label="Violin Plot",
+                                        checked=DEFAULT_ROUND_SCORE_DISTRIBUTION_INPUTS[
+                                            "violin_plot"
+                                        ],
+                                    ),
+                                ],
+                                style={"marginBottom": "20px"},
+                            ),
+                            html.Div(
+                                [
+                                    dmc.Checkbox(
+                                        id="round-score-distribution-boxplot-use-potential-points",
+                                        label="Use Potential Points",
+                                        checked=DEFAULT_ROUND_SCORE_DISTRIBUTION_INPUTS[
+                                            "use_potential_points"
+                                        ],
+                                    ),
+                                ],
+                                style={"marginBottom": "20px"},
+                            ),
+                        ],
+                    ),
+                ]
+            ),
+        ],
+        fluid=True,
+        style={
+            "paddingLeft": "1.5rem",
+            "paddingRight": "1.5rem",
+        },
+    )
+
+
+# Give Dash an empty skeleton of the layout to validate the callbacks against. Without this, assigning
+# serve_layout would make Dash call it right away (to validate it), loading every default figure at import.
+app.validation_layout = serve_layout(load_figures=False)
+
+# Assign the app layout
+app.layout = serve_layout
+
+# ================================
+# DEFINING CACHED FIGURE BUILDERS
+# ================================
+# Below, I'm going to define some helpers that build each figure and cache its JSON, keyed by the
+# callback inputs. The DataFrames never change while the app is running, so they're not part of the key.
+
+
+@cache.memoize(timeout=FIGURE_CACHE_TIMEOUT)
+def pct_points_scored_line_graph_json(
+    show_each_round: bool, show_dates: bool, rolling_avg_window_size: int
+) -> str:
+    """
+    This method will build the "Percentage of Total Points Scored" line graph, and return it as JSON.
+
+    Args:
+        - show_each_round (bool): Whether or not to show each round's data points.
+        - show_dates (bool): Whether or not to show the dates on the x-axis.
+        - rolling_avg_window_size (int): The size of the window for the rolling average.
+    """
+    return percentage_of_total_points_scored_line_graph(
+        round_level_stats_df=load_round_arrays(),
+        show_each_round=show_each_round,
+        show_dates=show_dates,
+        rolling_avg_window_size=rolling_avg_window_size,
+    ).to_json()
+
+
+@cache.memoize(timeout=FIGURE_CACHE_TIMEOUT)
+def win_loss_heatmap_json(show_dates: bool, show_longest_streak: bool) -> str:
+    """
+    This method will build the "Win-Loss Heatmap", and return it as JSON.
+
+    Args:
+        - show_dates (bool): Whether or not to show the dates on the x-axis.
+        - show_longest_streak (bool): Whether or not to show the longest win/loss streak.
+    """
+    return win_loss_heatmap(
+        game_level_stats_df=load_game_level_stats_df(),
+        show_dates=show_dates,
+        show_longest_streak=show_longest_streak,
+    ).to_json()
+
+
+@cache.memoize(timeout=FIGURE_CACHE_TIMEOUT)
+def round_score_distribution_boxplot_json(
+    violin_plot: bool, use_potential_points: bool
+) -> str:
+    """
+    This method will build the "Round Score Distribution" boxplot, and return it as JSON.
+
+    Args:
+        - violin_plot (bool): Whether or not to use a violin plot.
+        - use_potential_points (bool): Whether or not to use the potential points for each round.
+    """
+    return round_score_distribution_boxplot(
+        round_level_stats_df=load_round_level_stats_df(),
+        violin_plot=violin_plot,
+        use_potential_points=use_potential_points,
+    ).to_json()
+
 
 # ==========================
 # DEFINING THE APP CALLBACKS
 # ==========================
-# Below, I'm going to define the app callbacks.
+# Below, I'm going to define the app callbacks. Each graph has a dcc.Store holding the inputs it was
+# last drawn with, so that a callback firing with unchanged inputs (e.g. the slider being released on
+# the value it was dragged to) doesn't rebuild the figure. The store lives in the browser, so this
+# works per-client.
 
 
 @callback(
-    output=Output("pct-points-scored-line-graph", "figure"),
+    output=[
+        Output("pct-points-scored-line-graph", "figure"),
+        Output("pct-points-scored-line-graph-inputs", "data"),
+    ],
     inputs=[
         Input("pct-points-scored-show-each-round", "checked"),
         Input("pct-points-scored-show-dates", "checked"),
         Input("pct-points-scored-rolling-avg-slider", "value"),
     ],
+    state=[State("pct-points-scored-line-graph-inputs", "data")],
 )
 def update_pct_points_scored_line_graph(
-    show_each_round: bool, show_dates: bool, rolling_avg_window_size: int
+    show_each_round: bool,
+    show_dates: bool,
+    rolling_avg_window_size: int,
+    last_inputs: dict,
 ):
     """
     This callback will update the "Percentage of Total Points Scored" line graph.
@@ -356,46 +605,80 @@ def update_pct_points_scored_line_graph(
         - show_each_round (bool): Whether or not to show each round's data points.
         - show_dates (bool): Whether or not to show the dates on the x-axis.
         - rolling_avg_window_size (int): The size of the window for the rolling average.
+        - last_inputs (dict): The inputs that the graph was last drawn with.
     """
-    return percentage_of_total_points_scored_line_graph(
-        round_level_stats_df=round_level_stats_df,
+    inputs = dict(
         show_each_round=show_each_round,
         show_dates=show_dates,
         rolling_avg_window_size=rolling_avg_window_size,
     )
 
+    # If the graph was already drawn with these inputs, then there's nothing to update
+    if inputs == last_inputs:
+        raise PreventUpdate
+
+    # If the controls are in their initial state, then we can reuse the default figure
+    if inputs == DEFAULT_PCT_POINTS_SCORED_INPUTS:
+        return default_pct_points_scored_fig(), inputs
+
+    return (
+        json.loads(
+            pct_points_scored_line_graph_json(
+                show_each_round, show_dates, rolling_avg_window_size
+            )
+        ),
+        inputs,
+    )
+
 
 @callback(
-    output=Output("win-loss-heatmap", "figure"),
+    output=[
+        Output("win-loss-heatmap", "figure"),
+        Output("win-loss-heatmap-inputs", "data"),
+    ],
     inputs=[
         Input("win-loss-heatmap-show-dates", "checked"),
         Input("win-loss-heatmap-show-longest-streak", "checked"),
     ],
+    state=[State("win-loss-heatmap-inputs", "data")],
 )
-def update_win_loss_heatmap(show_dates: bool, show_longest_streak: bool):
+def update_win_loss_heatmap(
+    show_dates: bool, show_longest_streak: bool, last_inputs: dict
+):
     """
     This callback will update the "Win-Loss Heatmap".
 
     Args:
         - show_dates (bool): Whether or not to show the dates on the x-axis.
         - show_longest_streak (bool): Whether or not to show the longest win/loss streak.
+        - last_inputs (dict): The inputs that the heatmap was last drawn with.
     """
-    return win_loss_heatmap(
-        game_level_stats_df=game_level_stats_df,
-        show_dates=show_dates,
-        show_longest_streak=show_longest_streak,
-    )
+    inputs = dict(show_dates=show_dates, show_longest_streak=show_longest_streak)
+
+    # If the heatmap was already drawn with these inputs, then there's nothing to update
+    if inputs == last_inputs:
+        raise PreventUpdate
+
+    # If the controls are in their initial state, then we can reuse the default figure
+    if inputs == DEFAULT_WIN_LOSS_HEATMAP_INPUTS:
+        return default_win_loss_heatmap_fig(), inputs
+
+    return json.loads(win_loss_heatmap_json(show_dates, show_longest_streak)), inputs
 
 
 @callback(
-    output=Output("round-score-distribution-boxplot", "figure"),
+    output=[
+        Output("round-score-distribution-boxplot", "figure"),
+        Output("round-score-distribution-boxplot-inputs", "data"),
+    ],
     inputs=[
         Input("round-score-distribution-boxplot-violin-plot", "checked"),
         Input("round-score-distribution-boxplot-use-potential-points", "checked"),
     ],
+    state=[State("round-score-distribution-boxplot-inputs", "data")],
 )
 def update_round_score_distribution_boxplot(
-    violin_plot: bool, use_potential_points: bool
+    violin_plot: bool, use_potential_points: bool, last_inputs: dict
 ):
     """
     This callback will update the "Round Score Distribution" boxplot.
@@ -403,11 +686,23 @@ def update_round_score_distribution_boxplot(
     Args:
         - violin_plot (bool): Whether or not to use a violin plot.
         - use_potential_points (bool): Whether or not to use the potential points for each round.
+        - last_inputs (dict): The inputs that the boxplot was last drawn with.
     """
-    return round_score_distribution_boxplot(
-        round_level_stats_df=round_level_stats_df,
-        violin_plot=violin_plot,
-        use_potential_points=use_potential_points,
+    inputs = dict(violin_plot=violin_plot, use_potential_points=use_potential_points)
+
+    # If the boxplot was already drawn with these inputs, then there's nothing to update
+    if inputs == last_inputs:
+        raise PreventUpdate
+
+    # If the controls are in their initial state, then we can reuse the default figure
+    if inputs == DEFAULT_ROUND_SCORE_DISTRIBUTION_INPUTS:
+        return default_round_score_distribution_fig(), inputs
+
+    return (
+        json.loads(
+            round_score_distribution_boxplot_json(violin_plot, use_potential_points)
+        ),
+        inputs,
     )
 
 
@@ -10,17 +10,55 @@ and then prepare it for use in the app.
 
 # General import statements
 import pandas as pd
+import numpy as np
 import json
 from pathlib import Path
 
 # Importing custom-built modules
 from utils.google_drive import generate_credentials, download_google_sheet_as_excel
+from utils.visualizations import build_all_figures
+from utils.settings import (
+    DEFAULT_PCT_POINTS_SCORED_INPUTS,
+    DEFAULT_WIN_LOSS_HEATMAP_INPUTS,
+    DEFAULT_ROUND_SCORE_DISTRIBUTION_INPUTS,
+)
 
 # ============================
 # DEFINING THE PIPELINE METHOD
 # ============================
 # I'll declare the pipeline as a method, so that it can be run whenever we want to update the data.
 
+# These are the columns of the Google Sheet that the pipeline (and the app) actually use
+SOURCE_COLS = [
+    "game_date",
+    "round_num",
+    "trevor_points_scored",
+    "trevor_points_potential",
+    "sarah_points_scored",
+    "total_points_scorable",
+]
+
+# These are the fixed integer types that the score columns are saved as. They're fixed (rather than
+# picked to fit the data), so the Parquet schema doesn't change as scores grow, and so that adding two
+# columns together has headroom. Single rounds fit comfortably in int16, and game totals in int32.
+ROUND_LEVEL_SCORE_DTYPES = {
+    "round_num": np.int16,
+    "trevor_points_scored": np.int16,
+    "trevor_points_potential": np.int16,
+    "sarah_points_scored": np.int16,
+    "sarah_points_potential": np.int16,
+    "point_overlap": np.int16,
+    "total_points_scorable": np.int16,
+}
+GAME_LEVEL_SCORE_DTYPES = {
+    "trevor_total_points": np.int32,
+    "trevor_min_scoring_round": np.int16,
+    "trevor_max_scoring_round": np.int16,
+    "sarah_total_points": np.int32,
+    "sarah_min_scoring_round": np.int16,
+    "sarah_max_scoring_round": np.int16,
+}
+
 
 def run_pipeline():
     """
@@ -38,25 +76,34 @@ def run_pipeline():
     # Run the function to download the Google Sheet as an Excel file
     download_google_sheet_as_excel(spreadsheet_id, save_path)
 
-    # Loading in the original data
-    raw_boggle_data_df = pd.read_excel("data/boggle-game-records.xlsx")
+    # Loading in the original data (using the Rust-based calamine parser, which is much faster than openpyxl),
+    # and only parsing the columns we use. Nothing else needs the raw data, so we'll add new columns to this
+    # DataFrame directly.
+    boggle_data_df = pd.read_excel(
+        "data/boggle-game-records.xlsx", engine="calamine", usecols=SOURCE_COLS
+    )
 
-    # Make a copy of the original data, which we'll add new columns to
-    boggle_data_df = raw_boggle_data_df.copy()
+    # Make sure that the game_date is stored as a native datetime (rather than Python objects)
+    boggle_data_df["game_date"] = pd.to_datetime(boggle_data_df["game_date"])
 
     # Add a "point_overlap" column, which indicates how many points Trevor and Sarah have in common
-    boggle_data_df["point_overlap"] = boggle_data_df.apply(
-        lambda row: row.trevor_points_potential - row.trevor_points_scored, axis=1
+    boggle_data_df.eval(
+        "point_overlap = trevor_points_potential - trevor_points_scored", inplace=True
     )
 
     # Add a "sarah_points_potential" column, which indicates how many points Sarah could have gotten
-    boggle_data_df["sarah_points_potential"] = boggle_data_df.apply(
-        lambda row: row.sarah_points_scored + row.point_overlap, axis=1
+    boggle_data_df.eval(
+        "sarah_points_potential = sarah_points_scored + point_overlap", inplace=True
     )
 
-    # Create a new DataFrame that aggregates game-level information
+    # Create a new DataFrame that aggregates game-level information. The sheet is usually already in date
+    # order, in which case we can skip sorting the group keys (the game IDs below rely on date order).
     game_level_stats_df = (
-        boggle_data_df.groupby("game_date")
+        boggle_data_df.groupby(
+            "game_date",
+            sort=not boggle_data_df["game_date"].is_monotonic_increasing,
+            observed=True,
+        )
         .agg(
             trevor_total_points=("trevor_points_scored", "sum"),
             trevor_min_scoring_round=("trevor_points_scored", "min"),
@@ -64,27 +111,44 @@ def run_pipeline():
             sarah_total_points=("sarah_points_scored", "sum"),
             sarah_min_scoring_round=("sarah_points_scored", "min"),
             sarah_max_scoring_round=("sarah_points_scored", "max"),
-            trevor_points_list=("trevor_points_scored", list),
-            sarah_points_list=("sarah_points_scored", list),
         )
         .reset_index()
     )
 
     # Add a column indicating the winner of each game
-    game_level_stats_df["winner"] = game_level_stats_df.apply(
-        lambda row: (
-            "Trevor" if row.trevor_total_points > row.sarah_total_points else "Sarah"
-        ),
-        axis=1,
+    game_level_stats_df["winner"] = np.where(
+        game_level_stats_df["trevor_total_points"].to_numpy()
+        > game_level_stats_df["sarah_total_points"].to_numpy(),
+        "Trevor",
+        "Sarah",
     )
-    
+
     # Add an "id" column to the game-level stats (which is just a number from 0 to n-1)
-    game_level_stats_df["id"] = range(len(game_level_stats_df))
+    game_level_stats_df["id"] = np.arange(len(game_level_stats_df), dtype=np.int32)
+
+    # Cast the score columns to small, fixed integer types, since Boggle scores are small
+    boggle_data_df = boggle_data_df.astype(ROUND_LEVEL_SCORE_DTYPES)
+    game_level_stats_df = game_level_stats_df.astype(GAME_LEVEL_SCORE_DTYPES)
+
+    # Build the app's default version of each figure before anything is saved, so that if building them
+    # fails, the files from the previous run are left alone (rather than mixing new stats with old figures)
+    default_figs = build_all_figures(
+        game_level_stats_df=game_level_stats_df,
+        round_level_stats_df=boggle_data_df,
+        pct_points_scored_kwargs=DEFAULT_PCT_POINTS_SCORED_INPUTS,
+        win_loss_heatmap_kwargs=DEFAULT_WIN_LOSS_HEATMAP_INPUTS,
+        round_score_distribution_kwargs=DEFAULT_ROUND_SCORE_DISTRIBUTION_INPUTS,
+    )
 
-    # Save both the round-level and game-level stats as Excel file
-    boggle_data_df.to_excel("data/round-level-stats.xlsx", index=False)
-    game_level_stats_df.to_excel("data/game-level-stats.xlsx", index=False)
+    # Save both the round-level and game-level stats as Parquet files, which the app loads
+    boggle_data_df.to_parquet("data/round-level-stats.parquet", index=False)
+    game_level_stats_df.to_parquet("data/game-level-stats.parquet", index=False)
 
+    # Save the default figures as JSON, so the app can serve them without building them. These are written
+    # after the Parquet files, since the app ignores any figure JSON that's older than the stats.
+    Path("data/figs").mkdir(exist_ok=True, parents=True)
+    for fig_name, fig in default_figs.items():
+        Path(f"data/figs/{fig_name}.json").write_text(fig.to_json())
 
 # ====================
 # RUNNING THE PIPELINE
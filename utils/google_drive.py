@@ -9,7 +9,8 @@ This file contains code that interacts with the Google Drive API.
 
 # General import statements
 from pathlib import Path
-import io
+import os
+import tempfile
 
 # Importing different modules to help access Google Drive
 from google.auth.transport.requests import Request
@@ -18,6 +19,12 @@ from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.http import MediaIoBaseDownload
 
+# The number of bytes to request per chunk when downloading files
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# The file that the OAuth token is cached in between runs
+AUTH_TOKEN_PATH = Path("google_drive_auth_token.json")
+
 # =======
 # METHODS
 # =======
@@ -34,10 +41,8 @@ def generate_credentials(scopes):
     creds = None
 
     # First, check if the google_drive_auth_token.json file exists
-    if Path("google_drive_auth_token.json").exists():
-        creds = Credentials.from_authorized_user_file(
-            "google_drive_auth_token.json", scopes
-        )
+    if AUTH_TOKEN_PATH.exists():
+        creds = Credentials.from_authorized_user_file(str(AUTH_TOKEN_PATH), scopes)
 
     # If there are no valid credentials, let's generate some
     if not creds or not creds.valid:
@@ -47,9 +52,13 @@ def generate_credentials(scopes):
             flow = InstalledAppFlow.from_client_secrets_file("credentials.json", scopes)
             creds = flow.run_local_server(port=0)
 
-        # Save the credentials for the next run
-        with open("google_drive_auth_token.json", "w") as token:
+        # Save the credentials for the next run. They're written to a temporary file that's then
+        # swapped into place, so a crash mid-write (or a failed refresh) never leaves a truncated token.
+        with tempfile.NamedTemporaryFile(
+            "w", dir=AUTH_TOKEN_PATH.parent, suffix=".tmp", delete=False
+        ) as token:
             token.write(creds.to_json())
+        os.replace(token.name, AUTH_TOKEN_PATH)
 
     # Now that we have valid credentials, we can return them
     return creds
@@ -73,13 +82,20 @@ def download_google_sheet_as_excel(file_id, save_path):
         mimeType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
     )
 
-    file = io.BytesIO()
-    downloader = MediaIoBaseDownload(file, request)
-    done = False
-    while done is False:
-        status, done = downloader.next_chunk()
-        print(f"Download {int(status.progress() * 100)}%.")
-
-    # Finally, we'll write the file to disk
-    with open(save_path, "wb") as f:
-        f.write(file.getvalue())
+    # Finally, we'll stream the file chunk by chunk into a temporary file next to the save path, and only
+    # swap it into place once the download has finished (so a failed download never truncates the last
+    # good copy)
+    with tempfile.NamedTemporaryFile(
+        dir=Path(save_path).parent, suffix=".tmp", delete=False
+    ) as f:
+        try:
+            downloader = MediaIoBaseDownload(f, request, chunksize=DOWNLOAD_CHUNK_SIZE)
+            done = False
+            while done is False:
+                status, done = downloader.next_chunk()
+                print(f"Download {int(status.progress() * 100)}%.")
+        except BaseException:
+            f.close()
+            os.remove(f.name)
+            raise
+    os.replace(f.name, save_path)
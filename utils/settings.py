@@ -10,3 +10,14 @@ This util file contains various miscellaneous settings that will be used through
 TREVOR_COLOR = "#117E9B"
 SARAH_COLOR = "#D02F37"
 
+# The initial state of each figure's controls in the app (the pipeline also uses these to prebuild the figures)
+DEFAULT_ROLLING_AVG_WINDOW_SIZE = 15
+DEFAULT_PCT_POINTS_SCORED_INPUTS = dict(
+    show_each_round=True,
+    show_dates=False,
+    rolling_avg_window_size=DEFAULT_ROLLING_AVG_WINDOW_SIZE,
+)
+DEFAULT_WIN_LOSS_HEATMAP_INPUTS = dict(show_dates=False, show_longest_streak=True)
+DEFAULT_ROUND_SCORE_DISTRIBUTION_INPUTS = dict(
+    violin_plot=False, use_potential_points=False
+)
@@ -8,14 +8,331 @@ This app contains code for generating various visualizations.
 # The code below will help to set up the rest of the app.
 
 # General import statements
+import calendar
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from typing import Union
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
+from numba import njit
 
 # Importing specific settings
 from utils.settings import TREVOR_COLOR, SARAH_COLOR
 from utils.misc import abbreviate_month
 
+# ================
+# DATA PREPARATION
+# ================
+# The code below prepares the data that the visualizations read, as plain NumPy arrays.
+
+# A lookup table of abbreviated month names, indexed by month number (so index 0 is left blank)
+MONTH_ABBREV = np.array(
+    [""] + [abbreviate_month(calendar.month_name[month]) for month in range(1, 13)]
+)
+
+
+def check_game_dates(stats_df: pd.DataFrame):
+    """
+    This method will make sure that the game dates have already been parsed as datetimes (which
+    they should've been when the data was loaded), raising a TypeError if they haven't.
+
+    Args:
+        - stats_df (pd.DataFrame): A DataFrame with a "game_date" column.
+    """
+    if not pd.api.types.is_datetime64_dtype(stats_df["game_date"]):
+        raise TypeError(
+            f"game_date should be a datetime64 column, not {stats_df['game_date'].dtype}"
+        )
+
+
+def month_year_labels(game_dates: np.ndarray) -> np.ndarray:
+    """
+    This method will label each date with its abbreviated month and year (e.g., "Jan 2024").
+
+    Args:
+        - game_dates (np.ndarray): A datetime64 array of dates.
+
+    Returns:
+        A NumPy array of labels.
+    """
+    months_since_epoch = game_dates.astype("datetime64[M]").astype(np.int64)
+    return np.char.add(
+        np.char.add(MONTH_ABBREV[months_since_epoch % 12 + 1], " "),
+        (months_since_epoch // 12 + 1970).astype(str),
+    )
+
+
+@dataclass(frozen=True, eq=False)
+class RoundArrays:
+    """
+    This class holds the round-level columns used by the visualizations as NumPy arrays. Building
+    it once (rather than re-selecting the columns from a DataFrame on every call) lets repeat calls
+    skip pandas' column lookups. Instances hash and compare by a hash of their contents, so they
+    can be used as keys in the figure caches below.
+    """
+
+    game_date: np.ndarray
+    round_num: np.ndarray
+    trevor_points_scored: np.ndarray
+    sarah_points_scored: np.ndarray
+    total_points_scorable: np.ndarray
+
+    @classmethod
+    def from_df(cls, round_level_stats_df: pd.DataFrame) -> "RoundArrays":
+        """
+        This method will pull the columns out of the round-level stats DataFrame.
+
+        Args:
+            - round_level_stats_df (pd.DataFrame): A DataFrame containing round-level statistics.
+
+        Returns:
+            A RoundArrays instance.
+        """
+        # Make sure that the game dates have already been parsed as datetimes
+        check_game_dates(round_level_stats_df)
+
+        return cls(
+            game_date=round_level_stats_df["game_date"].to_numpy(),
+            round_num=round_level_stats_df["round_num"].to_numpy(),
+            trevor_points_scored=round_level_stats_df[
+                "trevor_points_scored"
+            ].to_numpy(),
+            sarah_points_scored=round_level_stats_df["sarah_points_scored"].to_numpy(),
+            total_points_scorable=round_level_stats_df[
+                "total_points_scorable"
+            ].to_numpy(),
+        )
+
+    @cached_property
+    def fingerprint(self) -> bytes:
+        """
+        This property will hash the full contents of every column (along with its dtype and
+        shape), so that any change to the data (or to the order of the rounds) changes it.
+        """
+        content_hash = hashlib.blake2b(digest_size=16)
+        for array in (
+            self.game_date,
+            self.round_num,
+            self.trevor_points_scored,
+            self.sarah_points_scored,
+            self.total_points_scorable,
+        ):
+            content_hash.update(f"{array.dtype.str}{array.shape}".encode())
+            content_hash.update(np.ascontiguousarray(array).tobytes())
+        return content_hash.digest()
+
+    def __hash__(self) -> int:
+        return hash(self.fingerprint)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, RoundArrays):
+            return NotImplemented
+        return self.fingerprint == other.fingerprint
+
+
+@dataclass(frozen=True, eq=False)
+class RoundAxis:
+    """
+    This class holds the parts of the line graph's x-axis that only depend on the data (and not on any
+    of the visualization's arguments), so they can be worked out once and reused across figures.
+    """
+
+    sort_order: Union[slice, np.ndarray]
+    game_ids: np.ndarray
+    month_start_game_ids: np.ndarray
+    month_start_labels: np.ndarray
+
+
+@lru_cache(maxsize=4)
+def prepare_round_axis(round_arrays: RoundArrays) -> RoundAxis:
+    """
+    This method will work out the order of the rounds, the ID of each round (which the line graph
+    uses for its x-axis), and the first round of each month. It's cached on the content hash of the
+    data, and the arrays it returns are read-only, since they're shared by every figure built from it.
+
+    Args:
+        - round_arrays (RoundArrays): The round-level columns.
+
+    Returns:
+        A RoundAxis instance.
+    """
+    # Sort everything by the game_date and round_num. The rounds are usually already in order, in which
+    # case we can skip the sort (and the copies it'd make) entirely.
+    game_date_diffs = np.diff(round_arrays.game_date.view("i8"))
+    round_num_diffs = np.diff(round_arrays.round_num.astype(np.int64))
+    if np.all(
+        (game_date_diffs > 0) | ((game_date_diffs == 0) & (round_num_diffs >= 0))
+    ):
+        sort_order = slice(None)
+    else:
+        sort_order = np.lexsort((round_arrays.round_num, round_arrays.game_date))
+    game_dates = round_arrays.game_date[sort_order]
+    round_nums = round_arrays.round_num[sort_order]
+
+    # Give each round an ID (which we'll use for the x-axis)
+    game_ids = (
+        pd.DatetimeIndex(game_dates).strftime("%Y-%m-%d %H:%M:%S")
+        + "-round-"
+        + pd.Index(round_nums).astype(str)
+    ).to_numpy()
+
+    # Get the first appearance of each month (the rounds are sorted, so these come out in order)
+    game_months = game_dates.astype("datetime64[M]")
+    _, month_start_idx = np.unique(game_months, return_index=True)
+
+    round_axis = RoundAxis(
+        sort_order=sort_order,
+        game_ids=game_ids,
+        month_start_game_ids=game_ids[month_start_idx],
+        month_start_labels=month_year_labels(game_dates[month_start_idx]),
+    )
+
+    # Lock the cached arrays, so that no caller can change them out from under later figures
+    for array in (
+        round_axis.sort_order,
+        round_axis.game_ids,
+        round_axis.month_start_game_ids,
+        round_axis.month_start_labels,
+    ):
+        if isinstance(array, np.ndarray):
+            array.setflags(write=False)
+    return round_axis
+
+
+# =================
+# NUMERICAL KERNELS
+# =================
+# The methods below loop over plain NumPy arrays, so they're JIT-compiled with Numba. They're
+# cached to disk, so the compilation cost is only paid once.
+
+
+@njit(cache=True, error_model="numpy")
+def pct_and_smooth(
+    trevor_points: np.ndarray,
+    sarah_points: np.ndarray,
+    total_points: np.ndarray,
+    window_size: int,
+    compute_smooth: bool = True,
+):
+    """
+    This method will compute each player's percentage of the total points in every round, along with
+    a trailing rolling mean of those percentages (matching pandas'
+    `.rolling(window=window_size, min_periods=1).mean()`), in a single pass over the arrays.
+
+    The rolling means keep a running sum, so each step adds one value and subtracts another instead
+    of re-averaging the window. Non-finite percentages (e.g. from a round with no scorable points)
+    are skipped, alongside a running count of the valid values, so a window with no valid values is NaN.
+    The largest percentage either player scored (ignoring NaNs, like `np.nanmax`) is tracked along the way.
+    If the rolling means aren't needed, they can be skipped entirely (and come back as empty arrays).
+
+    Args:
+        - trevor_points (np.ndarray): The points Trevor scored in each round.
+        - sarah_points (np.ndarray): The points Sarah scored in each round.
+        - total_points (np.ndarray): The total points that were scorable in each round.
+        - window_size (int): The size of the window for the rolling average.
+        - compute_smooth (bool): Whether or not to compute the rolling averages.
+
+    Returns:
+        A (trevor_pct, sarah_pct, trevor_pct_smooth, sarah_pct_smooth, max_pct) tuple, where the first four
+        are float64 arrays and max_pct is a float (NaN if there aren't any percentages).
+    """
+    n = total_points.shape[0]
+    trevor_pct = np.empty(n, dtype=np.float64)
+    sarah_pct = np.empty(n, dtype=np.float64)
+    smooth_n = n if compute_smooth else 0
+    trevor_pct_smooth = np.empty(smooth_n, dtype=np.float64)
+    sarah_pct_smooth = np.empty(smooth_n, dtype=np.float64)
+    trevor_sum, sarah_sum = 0.0, 0.0
+    trevor_count, sarah_count = 0, 0
+    max_pct = -np.inf
+    for i in range(n):
+        trevor_pct[i] = trevor_points[i] / total_points[i]
+        sarah_pct[i] = sarah_points[i] / total_points[i]
+
+        # Keep track of the largest percentage (NaNs fail both comparisons, so they're skipped)
+        if trevor_pct[i] > max_pct:
+            max_pct = trevor_pct[i]
+        if sarah_pct[i] > max_pct:
+            max_pct = sarah_pct[i]
+
+        if not compute_smooth:
+            continue
+
+        # Add the newest value to each window
+        if np.isfinite(trevor_pct[i]):
+            trevor_sum += trevor_pct[i]
+            trevor_count += 1
+        if np.isfinite(sarah_pct[i]):
+            sarah_sum += sarah_pct[i]
+            sarah_count += 1
+
+        # Drop the value that just fell out of each window
+        if i >= window_size:
+            if np.isfinite(trevor_pct[i - window_size]):
+                trevor_sum -= trevor_pct[i - window_size]
+                trevor_count -= 1
+            if np.isfinite(sarah_pct[i - window_size]):
+                sarah_sum -= sarah_pct[i - window_size]
+                sarah_count -= 1
+
+        trevor_pct_smooth[i] = trevor_sum / trevor_count if trevor_count > 0 else np.nan
+        sarah_pct_smooth[i] = sarah_sum / sarah_count if sarah_count > 0 else np.nan
+    if max_pct == -np.inf:
+        max_pct = np.nan
+    return trevor_pct, sarah_pct, trevor_pct_smooth, sarah_pct_smooth, max_pct
+
+
+@njit(cache=True)
+def longest_streaks(winner_codes: np.ndarray):
+    """
+    This method will find each player's longest run of consecutive wins in a single pass. If there's a
+    tie, the earliest run is used.
+
+    Args:
+        - winner_codes (np.ndarray): A uint8 array with the winner of each game, encoded as 0 (Sarah),
+            1 (Trevor), or 2 (neither).
+
+    Returns:
+        A (sarah_start_idx, sarah_length, trevor_start_idx, trevor_length) tuple describing the longest runs.
+    """
+    best_starts = np.zeros(2, dtype=np.int64)
+    best_lengths = np.zeros(2, dtype=np.int64)
+    current_start, current_length = 0, 0
+    for i in range(winner_codes.shape[0]):
+        code = winner_codes[i]
+
+        # Extend the current run if this game has the same winner as the last one; otherwise, start a new run
+        if i > 0 and code == winner_codes[i - 1]:
+            current_length += 1
+        else:
+            current_start, current_length = i, 1
+
+        # Keep track of the longest run for the player who won this game
+        if code < 2 and current_length > best_lengths[code]:
+            best_starts[code] = current_start
+            best_lengths[code] = current_length
+    return best_starts[0], best_lengths[0], best_starts[1], best_lengths[1]
+
+
+def warm_up_kernels():
+    """
+    This method will call each of the Numba kernels on a tiny input, so that they're compiled
+    (or loaded from the cache) before the first user interaction.
+    """
+    pct_and_smooth(
+        np.zeros(2, dtype=np.float64),
+        np.zeros(2, dtype=np.float64),
+        np.ones(2, dtype=np.float64),
+        1,
+        True,
+    )
+    longest_streaks(np.zeros(2, dtype=np.uint8))
+
+
 # =====================
 # VISUALIZATION METHODS
 # =====================
@@ -78,22 +395,24 @@ def total_wins_bar_chart(
     # Remove the x-axis title and ticks
     total_wins_fig.update_xaxes(title=None, showticklabels=False)
 
-    # Add annotation text in the middle of each bar to show the total wins
-    for i, row in total_wins_df.iterrows():
-        cur_wins = row["Wins"]
-
-        # Determine the x-position of the annotation
-        x_pos = cur_wins / 2
-
-        # Add the annotation, using the center of the text as the x-anchor
-        total_wins_fig.add_annotation(
-            x=x_pos,
-            y=row["Player"],
-            text=f"<b>{str(cur_wins)} wins</b><br><sub>{cur_wins/sum(total_wins_df['Wins'])*100:.0f}% of total games</sub>",
-            font=dict(size=annotation_font_size, color="white"),
-            showarrow=False,
-            xanchor="center",
-        )
+    # Add annotation text in the middle of each bar to show the total wins (and the percentage of games won)
+    wins = total_wins_df["Wins"].to_numpy()
+    pct_of_total_games = wins / wins.sum() * 100
+    total_wins_fig.update_layout(
+        annotations=[
+            dict(
+                x=cur_wins / 2,
+                y=player,
+                text=f"<b>{str(cur_wins)} wins</b><br><sub>{cur_pct:.0f}% of total games</sub>",
+                font=dict(size=annotation_font_size, color="white"),
+                showarrow=False,
+                xanchor="center",
+            )
+            for player, cur_wins, cur_pct in zip(
+                total_wins_df["Player"].to_numpy(), wins, pct_of_total_games
+            )
+        ]
+    )
 
     # Make the y-axis labels a little bigger
     total_wins_fig.update_yaxes(tickfont=dict(size=16))
@@ -106,7 +425,7 @@ def total_wins_bar_chart(
 
 
 def percentage_of_total_points_scored_line_graph(
-    round_level_stats_df: pd.DataFrame,
+    round_level_stats_df: Union[pd.DataFrame, RoundArrays],
     show_each_round: bool = False,
     show_dates: bool = False,
     show_rolling_avg: bool = True,
@@ -114,12 +433,14 @@ def percentage_of_total_points_scored_line_graph(
     hide_legend: bool = False,
     disabled_zoom: bool = True,
     plot_height: int = 350,
+    max_points: int = None,
 ):
     """
     This method will generate a line graph comparing the percentage of total points scored by Trevor and Sarah.
 
     Args:
-        - round_level_stats_df (pd.DataFrame): A DataFrame containing round-level statistics.
+        - round_level_stats_df (pd.DataFrame | RoundArrays): A DataFrame containing round-level statistics,
+            or the RoundArrays already pulled out of one.
         - show_each_round (bool): Whether or not to show each round's data points.
         - show_dates (bool): Whether or not to show the dates on the x-axis.
         - show_rolling_avg (bool): Whether or not to show a rolling average line.
@@ -127,59 +448,132 @@ def percentage_of_total_points_scored_line_graph(
         - hide_legend (bool): Whether or not to hide the legend.
         - disabled_zoom (bool): Whether or not to disable the zoom functionality.
         - plot_height (int): The height of the plot.
+        - max_points (int): The most points to draw in each of the per-round lines. If there are more rounds
+            than this, evenly-spaced rounds are picked out. (By default, every round is drawn.)
+
+    Figures are cached on (the data's fingerprint, the arguments), and each call returns its own copy
+    of the cached figure, so callers are free to modify it.
     """
-    # TODO: Fix the hovertext to be more detailed
 
-    # Make a copy of the round level stats, and add some important columns
-    pct_of_total_df = round_level_stats_df.copy()
-    pct_of_total_df["trevor_pct_total"] = (
-        pct_of_total_df["trevor_points_scored"]
-        / pct_of_total_df["total_points_scorable"]
-    )
-    pct_of_total_df["sarah_pct_total"] = (
-        pct_of_total_df["sarah_points_scored"]
-        / pct_of_total_df["total_points_scorable"]
-    )
-    pct_of_total_df["game_id"] = pct_of_total_df.apply(
-        lambda row: f"{row.game_date}-round-{row.round_num}", axis=1
+    # Pull the columns we need out as NumPy arrays (unless that's already been done)
+    if isinstance(round_level_stats_df, pd.DataFrame):
+        round_arrays = RoundArrays.from_df(round_level_stats_df)
+    else:
+        round_arrays = round_level_stats_df
+
+    # Build the figure (or grab it from the cache), and hand back a copy of it
+    pct_of_total_fig = _percentage_of_total_points_scored_line_graph(
+        round_arrays,
+        show_each_round,
+        show_dates,
+        show_rolling_avg,
+        rolling_avg_window_size,
+        hide_legend,
+        disabled_zoom,
+        plot_height,
+        max_points,
     )
+    return go.Figure(pct_of_total_fig)
+
+
+@lru_cache(maxsize=8)
+def _percentage_of_total_points_scored_line_graph(
+    round_arrays: RoundArrays,
+    show_each_round: bool,
+    show_dates: bool,
+    show_rolling_avg: bool,
+    rolling_avg_window_size: int,
+    hide_legend: bool,
+    disabled_zoom: bool,
+    plot_height: int,
+    max_points: int,
+):
+    """
+    This method will build the line graph for percentage_of_total_points_scored_line_graph. It's cached
+    on its arguments, so it should only be called through that method (which copies the figure before
+    handing it out).
+    """
+    # TODO: Fix the hovertext to be more detailed
 
-    # Compute moving averages
-    pct_of_total_df["trevor_pct_total_smooth"] = (
-        pct_of_total_df["trevor_pct_total"]
-        .rolling(window=rolling_avg_window_size, min_periods=1)
-        .mean()
-    )
-    pct_of_total_df["sarah_pct_total_smooth"] = (
-        pct_of_total_df["sarah_pct_total"]
-        .rolling(window=rolling_avg_window_size, min_periods=1)
-        .mean()
+    # Compute each player's percentage of the total points, along with their moving averages if they'll be
+    # shown (and the maximum y-value, taken before the percentages are rounded below)
+    (
+        trevor_pct_total,
+        sarah_pct_total,
+        trevor_pct_total_smooth,
+        sarah_pct_total_smooth,
+        max_y_value,
+    ) = pct_and_smooth(
+        round_arrays.trevor_points_scored.astype(np.float64, copy=False),
+        round_arrays.sarah_points_scored.astype(np.float64, copy=False),
+        round_arrays.total_points_scorable.astype(np.float64, copy=False),
+        rolling_avg_window_size,
+        show_rolling_avg,
     )
 
-    # Convert game_date to datetime and create a new column for x-axis labels
-    pct_of_total_df["game_date"] = pd.to_datetime(pct_of_total_df["game_date"])
-    pct_of_total_df["month"] = pct_of_total_df["game_date"].dt.month
-    pct_of_total_df["x_axis_label"] = pct_of_total_df.apply(
-        lambda row: f"{abbreviate_month(row.game_date.strftime('%B'))} {row.game_date.year}",
-        axis=1,
-    )
+    # Grab the order of the rounds, along with their IDs and month labels (which are cached per dataset)
+    round_axis = prepare_round_axis(round_arrays)
+    sort_order = round_axis.sort_order
+    game_ids = round_axis.game_ids
 
-    # Sort by the game_date and round_num
-    pct_of_total_df = pct_of_total_df.sort_values(
-        by=["game_date", "round_num"], ascending=[True, True]
-    )
+    # Sort and round only the percentages that'll be plotted. (Plotly writes each float out in full when
+    # the figure is serialized, and hundredths of a percent are already far finer than the plot can show.)
+    PLOT_DECIMALS = 4
+    if show_each_round:
+        trevor_pct_total = trevor_pct_total[sort_order].round(PLOT_DECIMALS)
+        sarah_pct_total = sarah_pct_total[sort_order].round(PLOT_DECIMALS)
+    if show_rolling_avg:
+        trevor_pct_total_smooth = trevor_pct_total_smooth[sort_order].round(
+            PLOT_DECIMALS
+        )
+        sarah_pct_total_smooth = sarah_pct_total_smooth[sort_order].round(PLOT_DECIMALS)
 
-    # Make the Plotly figure
-    pct_of_total_fig = go.Figure()
+    # Collect the traces and the layout as plain dicts, so that the figure can be built (and validated)
+    # in one go, rather than by a series of add_trace / update_layout calls. The traces are drawn with
+    # WebGL (scattergl), since there's a point for every round.
+    traces = []
+    FIGURE_MARGIN = 15
+    layout = dict(
+        # Remove the background grid
+        xaxis=dict(showgrid=False),
+        yaxis=dict(
+            showgrid=False,
+            # Set the y-axis range to be between 0 and the maximum y-value
+            range=[0, max_y_value],
+            # Add the title of the y-axis ("% of Total Points Scored")
+            title=dict(text="% of Total Points Scored"),
+            # Change the y-axis to be percentage with 0 decimal places
+            tickformat=".0%",
+        ),
+        plot_bgcolor="rgba(0,0,0,0)",
+        margin=dict(l=FIGURE_MARGIN, r=FIGURE_MARGIN, t=FIGURE_MARGIN, b=30),
+        # Make the legend appear in the top-right corner of the graph
+        legend=dict(x=1, y=1, xanchor="right", yanchor="top"),
+        # Make the plot height equal to the input
+        height=plot_height,
+    )
 
     # If the user wants to show each round, then add the data points
     if show_each_round:
 
+        # If there are too many rounds to draw, then pick out evenly-spaced rounds to draw instead. (Since
+        # the x-axis is categorical, we'll pin down the order of the rounds, too; otherwise, the rounds that
+        # were skipped here would be tacked onto the end of the x-axis by the smoothed lines.)
+        each_round_game_ids = game_ids
+        if max_points is not None and len(game_ids) > max_points:
+            each_round_idx = np.linspace(0, len(game_ids) - 1, max_points).astype(int)
+            each_round_game_ids = game_ids[each_round_idx]
+            trevor_pct_total = trevor_pct_total[each_round_idx]
+            sarah_pct_total = sarah_pct_total[each_round_idx]
+            layout["xaxis"]["categoryorder"] = "array"
+            layout["xaxis"]["categoryarray"] = game_ids
+
         # Add Sarah's line
-        pct_of_total_fig.add_trace(
-            go.Scatter(
-                x=pct_of_total_df["game_id"],
-                y=pct_of_total_df["sarah_pct_total"],
+        traces.append(
+            dict(
+                type="scattergl",
+                x=each_round_game_ids,
+                y=sarah_pct_total,
                 mode="lines",
                 name="Sarah",
                 line=dict(color=SARAH_COLOR),
@@ -189,10 +583,11 @@ def percentage_of_total_points_scored_line_graph(
         )
 
         # Add Trevor's line
-        pct_of_total_fig.add_trace(
-            go.Scatter(
-                x=pct_of_total_df["game_id"],
-                y=pct_of_total_df["trevor_pct_total"],
+        traces.append(
+            dict(
+                type="scattergl",
+                x=each_round_game_ids,
+                y=trevor_pct_total,
                 mode="lines",
                 name="Trevor",
                 line=dict(color=TREVOR_COLOR),
@@ -205,10 +600,11 @@ def percentage_of_total_points_scored_line_graph(
     if show_rolling_avg:
 
         # Add Trevor's smoothed line
-        pct_of_total_fig.add_trace(
-            go.Scatter(
-                x=pct_of_total_df["game_id"],
-                y=pct_of_total_df["trevor_pct_total_smooth"],
+        traces.append(
+            dict(
+                type="scattergl",
+                x=game_ids,
+                y=trevor_pct_total_smooth,
                 mode="lines",
                 name="Trevor",
                 line=dict(color=TREVOR_COLOR, width=4),
@@ -216,87 +612,58 @@ def percentage_of_total_points_scored_line_graph(
         )
 
         # Add Sarah's smoothed line
-        pct_of_total_fig.add_trace(
-            go.Scatter(
-                x=pct_of_total_df["game_id"],
-                y=pct_of_total_df["sarah_pct_total_smooth"],
+        traces.append(
+            dict(
+                type="scattergl",
+                x=game_ids,
+                y=sarah_pct_total_smooth,
                 mode="lines",
                 name="Sarah",
                 line=dict(color=SARAH_COLOR, width=4),
             )
         )
 
-    # Update the styling to remove the backgoround grid
-    FIGURE_MARGIN = 15
-    pct_of_total_fig.update_layout(
-        xaxis=dict(showgrid=False),
-        yaxis=dict(showgrid=False),
-        plot_bgcolor="rgba(0,0,0,0)",
-        margin=dict(l=FIGURE_MARGIN, r=FIGURE_MARGIN, t=FIGURE_MARGIN, b=30),
-    )
-
-    # Make the legend appear in the top-right corner of the graph
-    pct_of_total_fig.update_layout(
-        legend=dict(x=1, y=1, xanchor="right", yanchor="top")
-    )
-
-    # Determine the maximum y-value, and set the y-axis range to be between 0 and the maximum y-value
-    max_y_value = pct_of_total_df[["trevor_pct_total", "sarah_pct_total"]].max().max()
-    pct_of_total_fig.update_yaxes(range=[0, max_y_value])
-
-    # Add the title of the y-axis ("% of Total Points Scored")
-    pct_of_total_fig.update_yaxes(title_text="% of Total Points Scored")
-
-    # Change the y-axis to be percentage with 0 decimal places
-    pct_of_total_fig.update_yaxes(tickformat=".0%")
-
     # If the legend should be hidden, then hide it
     if hide_legend:
-        pct_of_total_fig.update_layout(showlegend=False)
+        layout["showlegend"] = False
 
     # If we want to disable zoom, then disable it
     if disabled_zoom:
-        pct_of_total_fig.update_layout(
-            xaxis=dict(fixedrange=True),
-            yaxis=dict(fixedrange=True),
-        )
-
-    # Make the plot height equal to the input
-    pct_of_total_fig.update_layout(height=plot_height)
+        layout["xaxis"]["fixedrange"] = True
+        layout["yaxis"]["fixedrange"] = True
 
     # If the user wants to show the dates, then update the x-axis to show the dates
     if show_dates:
 
-        # Get the first appearance of each month
-        first_appearance_of_month_df = pct_of_total_df[
-            ["game_id", "x_axis_label", "trevor_pct_total"]
-        ].drop_duplicates(subset=["x_axis_label"], keep="first")
-
-        # Update the x-axis to use the x_axis_label column
-        pct_of_total_fig.update_xaxes(
-            tickvals=first_appearance_of_month_df["game_id"],
-            ticktext=first_appearance_of_month_df["x_axis_label"],
-        )
-
-        # Add a vertical line for each first appearance of a month
-        for _, row in first_appearance_of_month_df.iterrows():
-            pct_of_total_fig.add_shape(
-                dict(
-                    type="line",
-                    x0=row["game_id"],
-                    x1=row["game_id"],
-                    y0=0,
-                    y1=1,
-                    line=dict(color="black", width=1, dash="dot"),
-                )
+        # Update the x-axis to use the month labels, placed at the first appearance of each month
+        first_appearance_of_month_game_ids = round_axis.month_start_game_ids
+        layout["xaxis"]["tickvals"] = first_appearance_of_month_game_ids
+        layout["xaxis"]["ticktext"] = round_axis.month_start_labels
+
+        # Add a vertical line for each first appearance of a month. These are drawn as a single
+        # trace (with None separating each line segment) rather than one shape per month.
+        month_line_count = len(first_appearance_of_month_game_ids)
+        month_line_xs = np.repeat(first_appearance_of_month_game_ids, 3).astype(object)
+        month_line_xs[2::3] = None
+        month_line_ys = np.tile(np.array([0, 1, None], dtype=object), month_line_count)
+        traces.append(
+            dict(
+                type="scattergl",
+                x=month_line_xs,
+                y=month_line_ys,
+                mode="lines",
+                line=dict(color="black", width=1, dash="dot"),
+                showlegend=False,
+                hoverinfo="skip",
             )
+        )
 
     # Otherwise, we'll hide the dates
     else:
-        pct_of_total_fig.update_xaxes(showticklabels=False)
+        layout["xaxis"]["showticklabels"] = False
 
-    # Return the figure
-    return pct_of_total_fig
+    # Make the Plotly figure, and return it
+    return go.Figure(data=traces, layout=layout)
 
 
 def win_loss_heatmap(
@@ -322,17 +689,20 @@ def win_loss_heatmap(
     """
     # TODO: Add some hovertext that's more detailed
 
-    # Transform the data into a 2D array, where the first one is Trevor's wins and the second one is Sarah's wins
-    win_loss_2d_array = [
-        [
-            0 if row.winner == "Sarah" else None
-            for row in game_level_stats_df.itertuples()
-        ],
+    # Make sure that the game dates have already been parsed as datetimes
+    check_game_dates(game_level_stats_df)
+
+    # Transform the data into a 2D array, where the first row is Sarah's wins and the second one is Trevor's
+    # wins (games that a player didn't win are NaN, which Plotly leaves blank)
+    winners = game_level_stats_df["winner"].to_numpy()
+    is_sarah_win = winners == "Sarah"
+    is_trevor_win = winners == "Trevor"
+    win_loss_2d_array = np.stack(
         [
-            1 if row.winner == "Trevor" else None
-            for row in game_level_stats_df.itertuples()
-        ],
-    ]
+            np.where(is_sarah_win, 0.0, np.nan),
+            np.where(is_trevor_win, 1.0, np.nan),
+        ]
+    )
 
     # Create the heatmap
     win_loss_heatmap = go.Figure(
@@ -351,40 +721,40 @@ def win_loss_heatmap(
     # If we want to show the dates, then we'll update the x-axis to show the dates
     if show_dates:
 
-        # Make a mapping between month/year and game number
-        first_month_appearance_df = game_level_stats_df[["game_date", "id"]].copy()
-        first_month_appearance_df["month"] = first_month_appearance_df[
-            "game_date"
-        ].dt.month
-        first_month_appearance_df["year"] = first_month_appearance_df[
-            "game_date"
-        ].dt.year
-        first_month_appearance_df["month_year_str"] = first_month_appearance_df.apply(
-            lambda row: f"{abbreviate_month(row.game_date.strftime('%B'))} {row.game_date.year}",
-            axis=1,
-        )
-
-        first_month_appearance_df = (
-            first_month_appearance_df.groupby("month_year_str")
-            .first()
-            .reset_index()
-            .drop(columns=["game_date"])
-        )
+        # Find the first game of each month, bucketing the dates by month rather than by their labels
+        game_dates = game_level_stats_df["game_date"].to_numpy()
+        first_appearance_of_month_idx = np.unique(
+            game_dates.astype("datetime64[M]"), return_index=True
+        )[1]
+        first_appearance_of_month_game_ids = game_level_stats_df["id"].to_numpy()[
+            first_appearance_of_month_idx
+        ]
 
         # Make the x-axis the month/year
         win_loss_heatmap.update_xaxes(
             tickmode="array",
-            tickvals=first_month_appearance_df.id,
-            ticktext=first_month_appearance_df.month_year_str,
+            tickvals=first_appearance_of_month_game_ids,
+            ticktext=month_year_labels(game_dates[first_appearance_of_month_idx]),
             tickangle=45,
         )
 
-        # Add dotted lines to separate the months
-        for row in first_month_appearance_df.itertuples():
-            game_id = row.id
-            win_loss_heatmap.add_vline(
-                x=game_id, line_dash="dot", line_color="black", line_width=1
-            )
+        # Add dotted lines to separate the months (spanning the full height of the plot), setting the
+        # shapes all at once rather than adding them one by one
+        win_loss_heatmap.update_layout(
+            shapes=[
+                dict(
+                    type="line",
+                    x0=game_id,
+                    x1=game_id,
+                    xref="x",
+                    y0=0,
+                    y1=1,
+                    yref="y domain",
+                    line=dict(color="black", width=1, dash="dot"),
+                )
+                for game_id in first_appearance_of_month_game_ids
+            ]
+        )
 
     # If we don't want to show dates, we'll hide the x-axis ticks and make the x-axis title "Game Number"
     else:
@@ -406,82 +776,89 @@ def win_loss_heatmap(
     # If we want to show the longest streak, then we'll determine the longest streak for each player
     if show_longest_streak:
 
-        # Determine the longest streak for each player, along with the game IDs
-        trevor_streak = 0
-        sarah_streak = 0
-        trevor_streak_game_ids = []
-        sarah_streak_game_ids = []
-        trevor_current_streak_game_ids = []
-        sarah_current_streak_game_ids = []
-        for row in game_level_stats_df.sort_values(
-            "game_date", ascending=True
-        ).itertuples():
-            cur_winner = row.winner
-            if cur_winner == "Trevor":
-                trevor_streak += 1
-                trevor_current_streak_game_ids.append(row.id)
-                if trevor_streak > len(trevor_streak_game_ids):
-                    trevor_streak_game_ids = trevor_current_streak_game_ids.copy()
-            else:
-                trevor_streak = 0
-                trevor_current_streak_game_ids = []
-
-            if cur_winner == "Sarah":
-                sarah_streak += 1
-                sarah_current_streak_game_ids.append(row.id)
-                if sarah_streak > len(sarah_streak_game_ids):
-                    sarah_streak_game_ids = sarah_current_streak_game_ids.copy()
-            else:
-                sarah_streak = 0
-                sarah_current_streak_game_ids = []
+        # Determine the longest streak for each player, along with the game IDs. Only the two columns
+        # we need are put in date order, rather than sorting the whole DataFrame (and the games are
+        # usually already in date order, in which case we can skip the sort entirely).
+        if game_level_stats_df["game_date"].is_monotonic_increasing:
+            date_order = slice(None)
+        else:
+            date_order = np.argsort(
+                game_level_stats_df["game_date"].to_numpy(), kind="stable"
+            )
 
-        # Outline the game IDs for the longest streaks
-        win_loss_heatmap.add_shape(
-            type="rect",
-            x0=min(trevor_streak_game_ids) - 0.5,
-            x1=max(trevor_streak_game_ids) + 0.5,
-            y0=0.5,
-            y1=1.5,
-            yanchor="bottom",
-            line=dict(color="black", width=3),
-        )
+        # Encode each game's winner as 0 (Sarah), 1 (Trevor), or 2 (neither), so that both players'
+        # longest streaks can be found in a single pass
+        winner_codes = np.full(len(winners), 2, dtype=np.uint8)
+        winner_codes[is_sarah_win] = 0
+        winner_codes[is_trevor_win] = 1
+        sorted_game_ids = game_level_stats_df["id"].to_numpy()[date_order]
+        (
+            sarah_streak_start,
+            sarah_streak_length,
+            trevor_streak_start,
+            trevor_streak_length,
+        ) = longest_streaks(winner_codes[date_order])
+        trevor_streak_game_ids = sorted_game_ids[
+            trevor_streak_start : trevor_streak_start + trevor_streak_length
+        ]
+        sarah_streak_game_ids = sorted_game_ids[
+            sarah_streak_start : sarah_streak_start + sarah_streak_length
+        ]
 
-        win_loss_heatmap.add_shape(
-            type="rect",
-            x0=min(sarah_streak_game_ids) - 0.5,
-            x1=max(sarah_streak_game_ids) + 0.5,
-            y0=-0.5,
-            y1=0.5,
-            yanchor="bottom",
-            line=dict(color="black", width=3),
-        )
+        # Outline the game IDs for the longest streaks
+        streak_shapes = [
+            dict(
+                type="rect",
+                x0=min(trevor_streak_game_ids) - 0.5,
+                x1=max(trevor_streak_game_ids) + 0.5,
+                y0=0.5,
+                y1=1.5,
+                yanchor="bottom",
+                line=dict(color="black", width=3),
+            ),
+            dict(
+                type="rect",
+                x0=min(sarah_streak_game_ids) - 0.5,
+                x1=max(sarah_streak_game_ids) + 0.5,
+                y0=-0.5,
+                y1=0.5,
+                yanchor="bottom",
+                line=dict(color="black", width=3),
+            ),
+        ]
 
         # Add an annotation for the longest streaks
         STREAK_FONT_SIZE = 16
         STREAK_FONT_COLOR = "black"
-        win_loss_heatmap.add_annotation(
-            x=(min(trevor_streak_game_ids) + max(trevor_streak_game_ids)) / 2,
-            y=1,
-            xref="x",
-            yref="y",
-            xanchor="center",
-            yanchor="middle",
-            text=f"<b>{len(trevor_streak_game_ids)}</b>",
-            showarrow=False,
-            font=dict(color=STREAK_FONT_COLOR, size=STREAK_FONT_SIZE),
-        )
-
-        # Add an annotation for the longest streaks
-        win_loss_heatmap.add_annotation(
-            x=(min(sarah_streak_game_ids) + max(sarah_streak_game_ids)) / 2,
-            y=0,
-            xref="x",
-            yref="y",
-            xanchor="center",
-            yanchor="middle",
-            text=f"<b>{len(sarah_streak_game_ids)}</b>",
-            showarrow=False,
-            font=dict(color=STREAK_FONT_COLOR, size=STREAK_FONT_SIZE),
+        streak_annotations = [
+            dict(
+                x=(min(trevor_streak_game_ids) + max(trevor_streak_game_ids)) / 2,
+                y=1,
+                xref="x",
+                yref="y",
+                xanchor="center",
+                yanchor="middle",
+                text=f"<b>{len(trevor_streak_game_ids)}</b>",
+                showarrow=False,
+                font=dict(color=STREAK_FONT_COLOR, size=STREAK_FONT_SIZE),
+            ),
+            dict(
+                x=(min(sarah_streak_game_ids) + max(sarah_streak_game_ids)) / 2,
+                y=0,
+                xref="x",
+                yref="y",
+                xanchor="center",
+                yanchor="middle",
+                text=f"<b>{len(sarah_streak_game_ids)}</b>",
+                showarrow=False,
+                font=dict(color=STREAK_FONT_COLOR, size=STREAK_FONT_SIZE),
+            ),
+        ]
+
+        # Add the outlines and annotations in a single layout update (keeping any month separators)
+        win_loss_heatmap.update_layout(
+            shapes=list(win_loss_heatmap.layout.shapes) + streak_shapes,
+            annotations=list(win_loss_heatmap.layout.annotations) + streak_annotations,
         )
 
     # If we want to disable zoom, then we'll disable it
@@ -518,32 +895,52 @@ def round_score_distribution_boxplot(
     """
     # TODO: Make the hovertext more detailed
 
-    # Create a DataFrame for the points scored per round
-    score_distribution_boxplot_df_records = []
-    for row in round_level_stats_df.itertuples():
-        for player in ["Trevor", "Sarah"]:
-            score_distribution_boxplot_df_records.append(
-                {
-                    "round_id": f"{row.game_date}_round_{row.round_num}",
-                    "game_date": row.game_date,
-                    "round_num": row.round_num,
-                    "player": player,
-                    "score": getattr(row, f"{player.lower()}_points_scored"),
-                    "points_potential": getattr(
-                        row, f"{player.lower()}_points_potential"
-                    ),
+    # Make sure that the game dates have already been parsed as datetimes
+    check_game_dates(round_level_stats_df)
+
+    # Create a DataFrame for the points scored per round, with one row for each player in each round
+    score_distribution_boxplot_df = pd.concat(
+        [
+            round_level_stats_df[
+                [
+                    "game_date",
+                    "round_num",
+                    f"{player.lower()}_points_scored",
+                    f"{player.lower()}_points_potential",
+                ]
+            ]
+            .rename(
+                columns={
+                    f"{player.lower()}_points_scored": "score",
+                    f"{player.lower()}_points_potential": "points_potential",
                 }
             )
-
-    # Create the DataFrame
-    score_distribution_boxplot_df = pd.DataFrame(score_distribution_boxplot_df_records)
+            .assign(player=player)
+            for player in ["Trevor", "Sarah"]
+        ],
+        ignore_index=True,
+    )
+    score_distribution_boxplot_df.insert(
+        0,
+        "round_id",
+        score_distribution_boxplot_df["game_date"].dt.strftime("%Y-%m-%d %H:%M:%S")
+        + "_round_"
+        + score_distribution_boxplot_df["round_num"].astype(str),
+    )
 
     # Make the Plotly figure
     score_col_to_use = "score" if not use_potential_points else "points_potential"
     score_col_label = (
         "Points Scored" if not use_potential_points else "Potential Points"
     )
-    score_distribution_fig = px.box(
+
+    # Pick the type of plot that was requested (the boxplot is given the requested height, while the
+    # violin plot keeps Plotly's default), and then make it
+    if violin_plot:
+        plot_fn, plot_kwargs = px.violin, {}
+    else:
+        plot_fn, plot_kwargs = px.box, dict(height=height)
+    score_distribution_fig = plot_fn(
         score_distribution_boxplot_df,
         x="player",
         y=score_col_to_use,
@@ -555,25 +952,9 @@ def round_score_distribution_boxplot(
         },
         color_discrete_map={"Trevor": TREVOR_COLOR, "Sarah": SARAH_COLOR},
         points="all",
-        height=height,
+        **plot_kwargs,
     )
 
-    # If the violin plot is requested, update the figure
-    if violin_plot:
-        score_distribution_fig = px.violin(
-            score_distribution_boxplot_df,
-            x="player",
-            y=score_col_to_use,
-            color="player",
-            labels={
-                "round_id": "Round ID",
-                score_col_to_use: score_col_label,
-                "player": "",
-            },
-            color_discrete_map={"Trevor": TREVOR_COLOR, "Sarah": SARAH_COLOR},
-            points="all",
-        )
-
     # Make the background white
     score_distribution_fig.update_layout(
         plot_bgcolor="white",
@@ -613,3 +994,60 @@ def round_score_distribution_boxplot(
 
     # Return the figure
     return score_distribution_fig
+
+
+# ====================
+# BUILDING ALL FIGURES
+# ====================
+# The method below builds every visualization at once.
+
+
+def build_all_figures(
+    game_level_stats_df: pd.DataFrame,
+    round_level_stats_df: pd.DataFrame,
+    pct_points_scored_kwargs: dict = None,
+    win_loss_heatmap_kwargs: dict = None,
+    round_score_distribution_kwargs: dict = None,
+) -> dict:
+    """
+    This method will build each of the visualizations in parallel. The figures don't depend on each
+    other, and much of the work behind them (in pandas, NumPy, and the Numba kernels) releases the GIL,
+    so a thread pool lets them overlap.
+
+    Args:
+        - game_level_stats_df (pd.DataFrame): A DataFrame containing game-level statistics.
+        - round_level_stats_df (pd.DataFrame): A DataFrame containing round-level statistics.
+        - pct_points_scored_kwargs (dict): Extra arguments for the percentage of total points line graph.
+        - win_loss_heatmap_kwargs (dict): Extra arguments for the win-loss heatmap.
+        - round_score_distribution_kwargs (dict): Extra arguments for the round score distribution boxplot.
+
+    Returns:
+        A dictionary mapping each figure's name to the Plotly figure.
+    """
+    # Kick off each of the figures in its own thread
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        fig_futures = {
+            "total-wins-bar-chart": executor.submit(
+                total_wins_bar_chart, game_level_stats_df
+            ),
+            "pct-points-scored-line-graph": executor.submit(
+                percentage_of_total_points_scored_line_graph,
+                round_level_stats_df,
+                **(pct_points_scored_kwargs or {}),
+            ),
+            "win-loss-heatmap": executor.submit(
+                win_loss_heatmap,
+                game_level_stats_df,
+                **(win_loss_heatmap_kwargs or {}),
+            ),
+            "round-score-distribution-boxplot": executor.submit(
+                round_score_distribution_boxplot,
+                round_level_stats_df,
+                **(round_score_distribution_kwargs or {}),
+            ),
+        }
+
+    # Return the finished figures
+    return {
+        fig_name: fig_future.result() for fig_name, fig_future in fig_futures.items()
+    }